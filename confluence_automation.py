@@ -1,18 +1,27 @@
 import base64
+import functools
+import html
 import io
+import logging
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-import matplotlib.pyplot as plt
-import pandas as pd
+# orjson parses/serializes the REST payloads faster than the stdlib json used by requests
+import orjson
 
 # Requests is used for HTTP requests to the Confluence REST API
 import requests
+import urllib3
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
 # Load environment variables from .env file if it exists
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # === CONFIGURATION ===
 # All configuration is now pulled from environment variables for portability
 CONFLUENCE_BASE_URL = os.environ.get("CONFLUENCE_BASE_URL", "").rstrip('/') # Ensure no trailing slash
@@ -25,13 +34,19 @@ PARENT_PAGE_TITLE = os.environ.get("CONFLUENCE_PARENT_TITLE")
 # Common headers for all API requests (Bearer token auth)
 COMMON_HEADERS = {"Authorization": f"Bearer {API_TOKEN}"}
 
-# Debug configuration
-print(f"DEBUG: Using Base URL: {CONFLUENCE_BASE_URL}")
-print(f"DEBUG: Space Key: {SPACE_KEY}")
-if API_TOKEN:
-    print(f"DEBUG: Token loaded: Yes (Starts with: {API_TOKEN[:5]}...)")
-else:
-    print("DEBUG: Token loaded: No")
+
+def log_configuration():
+    """
+    Logs the Confluence configuration in use (base URL, space key, whether a token is set).
+    Call it after logging is configured, e.g. right after basicConfig in a script's __main__.
+    """
+    logger.info("Using Base URL: %s", CONFLUENCE_BASE_URL)
+    logger.info("Space Key: %s", SPACE_KEY)
+    if API_TOKEN:
+        logger.info("Token loaded: Yes (Starts with: %s...)", API_TOKEN[:5])
+    else:
+        logger.info("Token loaded: No")
+
 
 # Path to CA certificates for SSL verification (can override with env if needed)
 # Defaulting to False (insecure) because internal CA certs are often not in Python's bundle.
@@ -40,29 +55,98 @@ CERT_PATH = os.environ.get("CONFLUENCE_CERT_PATH")
 
 # Disable warnings for insecure requests if verification is disabled
 if not CERT_PATH:
-    import urllib3
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-def get_page_id_by_title(title: str) -> str:
+
+class _ConfluenceSession(requests.Session):
+    """Session whose own `verify` setting is not overridden by REQUESTS_CA_BUNDLE/CURL_CA_BUNDLE."""
+
+    def merge_environment_settings(self, url, proxies, stream, verify, cert):
+        # requests prefers those env vars over Session.verify when a call passes no verify=
+        if verify is None:
+            verify = self.verify
+        return super().merge_environment_settings(url, proxies, stream, verify, cert)
+
+
+# Shared session so every Confluence call reuses pooled keep-alive connections
+# instead of paying a fresh TCP+TLS handshake per request.
+SESSION = _ConfluenceSession()
+SESSION.headers.update(COMMON_HEADERS)
+# SSL verification is configured once here, not per call: use CERT_PATH only if
+# it's set, otherwise False (insecure but working)
+SESSION.verify = CERT_PATH or False
+
+
+class _ConfluenceRetry(urllib3.Retry):
+    """
+    Retry policy that only repeats a POST when the server provably did not process it:
+    a 429/503 that carries a Retry-After header. POSTs are not idempotent here (a repeated
+    page create fails on the duplicate title, a repeated attachment /data POST adds another
+    version), so 5xx responses and read errors after sending are never retried for them.
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method.upper() == "POST":
+            return bool(self.total and has_retry_after and status_code in (429, 503))
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+# Transient failures (rate limiting, 5xx) of GET/PUT are retried with jittered
+# exponential backoff, honoring Retry-After; POST only as described above.
+# Once retries are exhausted the last response is returned and the callers
+# report its status code as before.
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=_ConfluenceRetry(
+        total=5,
+        backoff_factor=1.0,
+        backoff_jitter=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(["GET", "PUT"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    ),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# Page IDs resolved or created during this run, keyed by (title, space key)
+_PAGE_ID_CACHE = {}
+# Pages may be created from several threads at once (see upload_ils.upload_skill_files)
+_PAGE_ID_CACHE_LOCK = threading.Lock()
+
+
+class PageNotFoundError(Exception):
+    """Raised by get_page_id_by_title when no page with the title exists in the space."""
+
+
+def _cache_page_id(title: str, page_id: str):
+    """Remembers the ID of a page so later lookups by title skip the GET."""
+    with _PAGE_ID_CACHE_LOCK:
+        _PAGE_ID_CACHE[(title, SPACE_KEY)] = page_id
+
+def get_page_id_by_title(title: str, expand: str = "") -> str:
     """
     Returns the page ID for a given title in a Confluence space using hardcoded config.
-    Raises an exception if the page is not found or the request fails.
+    Only the first match is requested and nothing is expanded unless `expand` asks for it
+    (e.g. "ancestors"), which keeps the response small.
+    Raises PageNotFoundError if the page is not found, or an exception if the request fails.
+    Results are cached for the rest of the run; see invalidate_page_id.
     """
     if not CONFLUENCE_BASE_URL or not SPACE_KEY:
          raise ValueError("Missing configuration: CONFLUENCE_BASE_URL or SPACE_KEY not set.")
 
+    cached_id = _PAGE_ID_CACHE.get((title, SPACE_KEY))
+    if cached_id is not None:
+        return cached_id
+
     url = f"{CONFLUENCE_BASE_URL}/rest/api/content"
-    params = {"title": title, "spaceKey": SPACE_KEY, "expand": "ancestors"}
-    
-    # Use verify=CERT_PATH only if it's set, otherwise False (insecure but working)
-    verify_ssl = CERT_PATH if CERT_PATH else False
-
-    response = requests.get(
-        url,
-        params=params,
-        verify=verify_ssl,
-        headers=COMMON_HEADERS,
-    )
+    params = {"title": title, "spaceKey": SPACE_KEY, "limit": 1}
+    if expand:
+        params["expand"] = expand
+
+    response = SESSION.get(url, params=params)
     # Check for HTTP errors
     if response.status_code != 200:
         raise Exception(
@@ -70,20 +154,28 @@ def get_page_id_by_title(title: str) -> str:
         )
     
     try:
-        data = response.json()
-    except requests.exceptions.JSONDecodeError:
+        data = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
         # If headers are wrong, we might get an HTML login page.
-        print(f"DEBUG: Failed to decode JSON. Response text preview:\n{response.text[:500]}...")
+        logger.error("Failed to decode JSON. Response text preview:\n%s...", response.text[:500])
         raise
         
     # Check if the page exists
     if data["size"] == 0:
-        raise Exception(f"No page found with title '{title}' in space '{SPACE_KEY}'")
+        raise PageNotFoundError(f"No page found with title '{title}' in space '{SPACE_KEY}'")
     # Return the first matching page's ID
-    return data["results"][0]["id"]
+    page_id = data["results"][0]["id"]
+    _cache_page_id(title, page_id)
+    return page_id
+
+
+def invalidate_page_id(title: str):
+    """Drops the cached page ID for a title, e.g. after the page was renamed or deleted."""
+    with _PAGE_ID_CACHE_LOCK:
+        _PAGE_ID_CACHE.pop((title, SPACE_KEY), None)
 
 
-def new_page(title: str, content: str, parent: str = PARENT_PAGE_TITLE):
+def new_page(title: str, content: str, parent: str = PARENT_PAGE_TITLE, parent_id: str = None):
     """
     Creates a Confluence page under the parent page with the given title.
     If the page already exists under the parent, replaces its content.
@@ -91,29 +183,31 @@ def new_page(title: str, content: str, parent: str = PARENT_PAGE_TITLE):
         parent: The title of the parent (ancestor) page.
         title: The title of the new page to create or update.
         content: The HTML content for the new page.
+        parent_id: The parent page's ID, if already known (e.g. returned by an earlier new_page).
+            Skips resolving `parent` by title.
+    Returns:
+        The ID of the created or updated page (taken from the API response, so callers
+        don't need a separate lookup), or None if the request failed.
     """
-    verify_ssl = CERT_PATH if CERT_PATH else False
-
-    # Get the parent page's ID by title
-    try:
-        parent_id = get_page_id_by_title(parent)
-    except Exception as e:
-        print(f"Error finding parent page '{parent}': {e}")
-        return
+    # Get the parent page's ID by title, unless the caller already knows it
+    if parent_id is None:
+        try:
+            parent_id = get_page_id_by_title(parent)
+        except Exception as e:
+            logger.error("Error finding parent page '%s': %s", parent, e)
+            return
 
     url = f"{CONFLUENCE_BASE_URL}/rest/api/content/"
-    headers = {"Content-Type": "application/json", **COMMON_HEADERS}
+    headers = {"Content-Type": "application/json"}
 
     # Check if the page already exists under the parent
     params = {"title": title, "spaceKey": SPACE_KEY, "expand": "ancestors,version"}
-    resp = requests.get(
-        url[:-1], params=params, verify=verify_ssl, headers=COMMON_HEADERS
-    )
+    resp = SESSION.get(url[:-1], params=params)
     page_exists = False
     page_id = None
     version = 1
     if resp.status_code == 200:
-        data = resp.json()
+        data = orjson.loads(resp.content)
         for result in data.get("results", []):
             ancestors = result.get("ancestors", [])
             # Only update if the ancestor matches the parent
@@ -135,19 +229,18 @@ def new_page(title: str, content: str, parent: str = PARENT_PAGE_TITLE):
             "body": {"storage": {"value": content, "representation": "storage"}},
             "version": {"number": version},
         }
-        response = requests.put(
-            update_url,
-            json=payload,
-            headers=headers,
-            verify=verify_ssl,
-        )
+        response = SESSION.put(update_url, data=orjson.dumps(payload), headers=headers)
         if response.status_code == 200:
-            print("Page updated successfully!")
-            print("URL:", CONFLUENCE_BASE_URL + response.json()["_links"]["webui"])
+            _cache_page_id(title, page_id)
+            logger.info("Page updated successfully!")
+            logger.info("URL: %s", CONFLUENCE_BASE_URL + orjson.loads(response.content)["_links"]["webui"])
+            return page_id
         else:
-            print("Failed to update page")
-            print("Status Code:", response.status_code)
-            print("Response:", response.text)
+            logger.error(
+                "Failed to update page. Status Code: %s Response: %s",
+                response.status_code,
+                response.text,
+            )
     else:
         # Create new page (POST request)
         payload = {
@@ -157,99 +250,172 @@ def new_page(title: str, content: str, parent: str = PARENT_PAGE_TITLE):
             "space": {"key": SPACE_KEY},
             "body": {"storage": {"value": content, "representation": "storage"}},
         }
-        response = requests.post(
-            url,
-            json=payload,
-            headers=headers,
-            verify=verify_ssl,
-        )
+        response = SESSION.post(url, data=orjson.dumps(payload), headers=headers)
         if response.status_code == 200 or response.status_code == 201:
-            print("Page created successfully!")
-            print("URL:", CONFLUENCE_BASE_URL + response.json()["_links"]["webui"])
+            data = orjson.loads(response.content)
+            _cache_page_id(title, data["id"])
+            logger.info("Page created successfully!")
+            logger.info("URL: %s", CONFLUENCE_BASE_URL + data["_links"]["webui"])
+            return data["id"]
         else:
-            print("Failed to create page")
-            print("Status Code:", response.status_code)
-            print("Response:", response.text)
+            logger.error(
+                "Failed to create page. Status Code: %s Response: %s",
+                response.status_code,
+                response.text,
+            )
+
+
+def cdata_safe_text(raw: bytes) -> str:
+    """
+    Turns a source file's bytes into text that can sit inside a CDATA section (e.g. a code macro).
+    Decodes as UTF-8 (dropping invalid bytes), normalizes CRLF and lone CR to LF like text-mode
+    reading, then escapes the CDATA closing tag. Decoding comes first because dropping invalid
+    bytes can join a new ']]>' together. Each rewrite is skipped when its pattern is absent,
+    which avoids copying the whole text.
+    """
+    text = raw.decode("utf-8", errors="ignore")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    if "]]>" in text:
+        text = text.replace("]]>", "]]]]><![CDATA[>")
+    return text
 
 
 def encode_matplotlib_fig(fig) -> bytes:
     """Turns a matplotlib figure into png bytes"""
     image = io.BytesIO()  # acts like a file
     fig.savefig(image, format="png", pad_inches=0, bbox_inches="tight")
-    image.seek(0)  # at this point, `image` is a bunch of bytes that is a png
-    return image.read()
+    return image.getvalue()  # the png bytes, without seeking back and reading a copy
 
 
 def upload_attachment_to_page(
-    page_id: str, filename: str, file_bytes: bytes, mime_type: str = "image/png"
+    page_id: str, filename: str, file_data, mime_type: str = "image/png"
 ):
     """
     Uploads a file as an attachment to the specified Confluence page.
+    file_data is either the file's bytes or a binary file-like object (e.g. an open file).
+    Passing a file object saves the caller a copy, but the upload is not streamed: requests
+    still reads it fully and builds the whole multipart body in memory.
     If an attachment with the same filename exists, it will be replaced (updated).
     Returns the attachment info (JSON) or raises an exception on failure.
     """
-    verify_ssl = CERT_PATH if CERT_PATH else False
     url = f"{CONFLUENCE_BASE_URL}/rest/api/content/{page_id}/child/attachment"
-    headers = {"X-Atlassian-Token": "no-check", **COMMON_HEADERS}
-    files = {"file": (filename, file_bytes, mime_type)}
-    # Try to upload as new attachment
-    response = requests.post(url, headers=headers, files=files, verify=verify_ssl)
-    if response.status_code == 400 and "same file name" in response.text:
-        # Attachment exists, update it
-        # Get the attachment ID
-        att_url = f"{CONFLUENCE_BASE_URL}/rest/api/content/{page_id}/child/attachment?filename={filename}&expand=results"
-        att_resp = requests.get(att_url, headers=COMMON_HEADERS, verify=verify_ssl)
-        if att_resp.status_code == 200:
-            results = att_resp.json().get("results", [])
-            if results:
-                att_id = results[0]["id"]
-                update_url = f"{CONFLUENCE_BASE_URL}/rest/api/content/{page_id}/child/attachment/{att_id}/data"
-                update_resp = requests.post(
-                    update_url, headers=headers, files=files, verify=verify_ssl
-                )
-                if update_resp.status_code in (200, 201):
-                    return update_resp.json()
-                else:
-                    raise Exception(
-                        f"Failed to update attachment: {update_resp.status_code} {update_resp.text}"
-                    )
-        raise Exception(
-            f"Failed to find existing attachment to update: {att_resp.status_code} {att_resp.text}"
-        )
-    elif response.status_code not in (200, 201):
+    headers = {"X-Atlassian-Token": "no-check"}
+    files = {"file": (filename, file_data, mime_type)}
+
+    # Look up an existing attachment with this filename first, so that both the
+    # new and the re-upload case take a single POST
+    att_resp = SESSION.get(url, params={"filename": filename, "limit": 1})
+    if att_resp.status_code != 200:
         raise Exception(
-            f"Failed to upload attachment: {response.status_code} {response.text}"
+            f"Failed to look up existing attachment: {att_resp.status_code} {att_resp.text}"
         )
-    return response.json()
+    results = orjson.loads(att_resp.content).get("results", [])
 
+    if results:
+        # Attachment exists, update its data
+        att_id = results[0]["id"]
+        update_url = f"{url}/{att_id}/data"
+        response = SESSION.post(update_url, headers=headers, files=files)
+        if response.status_code not in (200, 201):
+            raise Exception(
+                f"Failed to update attachment: {response.status_code} {response.text}"
+            )
+    else:
+        # Upload as new attachment
+        response = SESSION.post(url, headers=headers, files=files)
+        if response.status_code not in (200, 201):
+            raise Exception(
+                f"Failed to upload attachment: {response.status_code} {response.text}"
+            )
+    return orjson.loads(response.content)
 
-def generate_sample_data_and_plot():
+
+def generate_sample_data():
     """
-    Generates a sample pandas DataFrame and a matplotlib plot, returns both as HTML strings.
-    The plot is uploaded as an attachment and referenced in the page content.
+    Generates a sample pandas DataFrame, returns it together with its HTML table.
     """
-    # Create sample data
+    # Imported here so scripts that only upload files (upload_ils.py) don't pay for pandas
+    import pandas as pd
+
     df = pd.DataFrame({"Category": ["A", "B", "C", "D"], "Value": [23, 45, 12, 36]})
-    # Create a bar plot
-    fig, ax = plt.subplots(figsize=(4, 3), dpi=150)
-    df.plot(
-        kind="bar",
-        x="Category",
-        y="Value",
-        ax=ax,
-        legend=False,
-        color="skyblue",
-    )
-    ax.set_title("Sample Bar Plot")
-    ax.set_ylabel("Value")
-    plt.tight_layout()
-    img_bytes = encode_matplotlib_fig(fig)
-    plt.close(fig)
     # DataFrame as HTML table
     table_html = df.to_html(
         index=False, border=0, classes="confluenceTable", justify="center"
     )
-    return table_html, img_bytes
+    return df, table_html
+
+
+def plot_sample_data(df) -> bytes:
+    """Renders the sample DataFrame as a bar plot and returns it as png bytes"""
+    # Imported here so scripts that only upload files (upload_ils.py) don't pay for matplotlib
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    # Render straight onto an Agg canvas: no pyplot state machine, no GUI backend,
+    # and nothing registered globally that would need closing afterwards.
+    fig = Figure(figsize=(4, 3), dpi=150)
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    ax.bar(df["Category"], df["Value"], color="skyblue")
+    ax.set_title("Sample Bar Plot")
+    ax.set_xlabel("Category")
+    ax.set_ylabel("Value")
+    fig.tight_layout()
+    return encode_matplotlib_fig(fig)
+
+
+def generate_sample_data_and_plot():
+    """
+    Generates a sample pandas DataFrame and a matplotlib plot, returns the table as HTML and the plot as png bytes.
+    The plot is uploaded as an attachment and referenced in the page content.
+    """
+    df, table_html = generate_sample_data()
+    return table_html, plot_sample_data(df)
+
+
+def get_or_create_page(
+    title: str, content: str, parent: str = PARENT_PAGE_TITLE, parent_id: str = None
+) -> str:
+    """
+    Returns the ID of the page with the given title, creating it with the given content under
+    the parent page only if it does not exist yet. An existing page is left untouched, so
+    re-runs cost a single (cached) lookup instead of a rewrite.
+    Raises an exception if the lookup fails, or if the page is missing and could not be created.
+    """
+    try:
+        return get_page_id_by_title(title)
+    except PageNotFoundError:
+        pass
+    page_id = new_page(title, content, parent, parent_id=parent_id)
+    if page_id is None:
+        raise Exception(f"Failed to create page '{title}'")
+    return page_id
+
+
+def get_or_create_empty_page(title: str, parent: str = PARENT_PAGE_TITLE) -> str:
+    """
+    Returns the ID of the page with the given title, creating it with a minimal body under
+    the parent page if it does not exist yet. Useful when a page must exist (e.g. to receive
+    attachments) before its real content is written.
+    """
+    return get_or_create_page(title, "<p></p>", parent)
+
+
+@functools.lru_cache(maxsize=1)
+def _source_code_block(mtime: float) -> str:
+    """
+    Returns this module's source as an escaped Confluence code macro.
+    Cached on the file's modification time so repeated calls skip the read and escape.
+    """
+    # Read this file's code
+    with open(__file__, "r", encoding="utf-8") as f:
+        code = f.read()
+
+    # Simple escaping for XML/HTML in the code block (&, < and > in a single pass)
+    code = html.escape(code, quote=False)
+
+    return f'<ac:structured-macro ac:name="code"><ac:plain-text-body><![CDATA[{code}]]></ac:plain-text-body></ac:structured-macro>'
 
 
 def create_confluence_automation_page():
@@ -265,7 +431,7 @@ def create_confluence_automation_page():
     """
     # Validate env vars
     if not all([CONFLUENCE_BASE_URL, API_TOKEN, SPACE_KEY, PARENT_PAGE_TITLE]):
-        print("Missing required environment variables. Please check configuration.")
+        logger.error("Missing required environment variables. Please check configuration.")
         return
 
     # Disclaimer and notice at the top of the page
@@ -301,14 +467,6 @@ def create_confluence_automation_page():
 <code>https://wiki.ith.intel.com/display/<b>DefmetYieldResources</b>/Confluence+Automation</code><br/>
 The value after <code>/display/</code> and before the next <code>/</code> is your <b>space_key</b> (here: <code>DefmetYieldResources</code>).</p>
 """
-    # Read this file's code and escape CDATA end markers
-    with open(__file__, "r", encoding="utf-8") as f:
-        code = f.read()
-    
-    # Simple escaping for XML/HTML in the code block
-    code = code.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-    
-    code_block = f'<ac:structured-macro ac:name="code"><ac:plain-text-body><![CDATA[{code}]]></ac:plain-text-body></ac:structured-macro>'
     example_usage = """
 <h2>How to Use This Script</h2>
 <ol>
@@ -319,42 +477,20 @@ The value after <code>/display/</code> and before the next <code>/</code> is you
       <code>python confluence.py</code></li>
 </ol>
 """
-    table_html, img_bytes = generate_sample_data_and_plot()
-    # Get the page ID (will create/update page after this)
-    # parent_id = get_page_id_by_title(PARENT_PAGE_TITLE) 
-    # ^ Not needed to call explicitly here, new_page calls it.
-    
-    # Create or update the page first to get its ID
-    # (We need the page to exist before uploading the attachment)
-    # Temporarily use a placeholder for the image macro
-    img_html = "<p><i>Uploading plot...</i></p>"
-    sample_section = f"""
-<h2>Sample Data and Plot</h2>
-<p>This section demonstrates embedding a pandas DataFrame as an HTML table and a matplotlib plot as an attachment image:</p>
-<h3>Sample Data Table</h3>
-{table_html}
-<h3>Sample Plot</h3>
-{img_html}
-"""
-    content = (
-        disclaimer
-        + notice
-        + instructions
-        + sample_section
-        + "<h2>Script Source Code</h2>"
-        + code_block
-        + example_usage
-    )
-    # Create or update the page (get its ID)
-    new_page("Confluence Automation", content)
-    
-    # Get the page ID for the new/updated page
-    page_id = get_page_id_by_title("Confluence Automation")
-    
+    df, table_html = generate_sample_data()
+
+    # The page must exist before the plot can be attached to it. Make sure it does
+    # (and get its ID) in a worker thread while the plot renders here.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        page_future = executor.submit(get_or_create_empty_page, "Confluence Automation")
+        img_bytes = plot_sample_data(df)
+        page_id = page_future.result()
+
     # Upload the plot as an attachment
     upload_attachment_to_page(page_id, "plot.png", img_bytes)
-    
-    # Now update the page again, referencing the attachment
+
+    # Write the full content once, referencing the attachment
+    code_block = _source_code_block(os.path.getmtime(__file__))
     img_html = '<ac:image><ri:attachment ri:filename="plot.png"/></ac:image>'
     sample_section = f"""
 <h2>Sample Data and Plot</h2>
@@ -389,20 +525,26 @@ The value after <code>/display/</code> and before the next <code>/</code> is you
 </ul>
 This document and the code below are intended as a portable, self-contained example for automating Confluence content generation and image embedding.</p>
 """
-    content = (
-        intro
-        + disclaimer
-        + notice
-        + instructions
-        + image_upload_explanation
-        + sample_section
-        + "<h2>Script Source Code</h2>"
-        + code_block
-        + example_usage
+    # Joined in one go rather than through a chain of intermediate concatenations
+    content = "".join(
+        [
+            intro,
+            disclaimer,
+            notice,
+            instructions,
+            image_upload_explanation,
+            sample_section,
+            "<h2>Script Source Code</h2>",
+            code_block,
+            example_usage,
+        ]
     )
     new_page("Confluence Automation", content)
 
 
 if __name__ == "__main__":
+    # Show progress on the console
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    log_configuration()
     # Ultra simple: just create/update the Confluence Automation page when run
     create_confluence_automation_page()
@@ -1,20 +1,32 @@
+import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 # Import functions from your existing automation script
 try:
-    from confluence_automation import new_page, upload_attachment_to_page, get_page_id_by_title, PARENT_PAGE_TITLE
+    from confluence_automation import new_page, upload_attachment_to_page, get_page_id_by_title, cdata_safe_text, log_configuration, PARENT_PAGE_TITLE
 except ImportError:
     print("Error: Could not import 'confluence_automation.py'. Make sure it is in the same folder.")
     sys.exit(1)
 
+logger = logging.getLogger(__name__)
+
 def upload_skill_file(file_path: str, page_title: str = None):
     """
     Reads a SKILL file (.il or .ils), creates a Confluence page with the code embedded, 
     and uploads the file as an attachment.
     """
-    if not os.path.exists(file_path):
-        print(f"Error: File not found at '{file_path}'")
+    # 1. Read file content once; the bytes are reused for the attachment upload.
+    # A missing file surfaces as FileNotFoundError, so no separate existence check.
+    try:
+        raw = Path(file_path).read_bytes()
+    except FileNotFoundError:
+        logger.error("File not found at '%s'", file_path)
+        return
+    except Exception as e:
+        logger.error("Error reading file: %s", e)
         return
 
     filename = os.path.basename(file_path)
@@ -23,22 +35,13 @@ def upload_skill_file(file_path: str, page_title: str = None):
     if not page_title:
         page_title = filename
 
-    print(f"\nProcessing: {filename}")
-    print(f"Target Page: '{page_title}'")
-    print(f"Parent Page: '{PARENT_PAGE_TITLE}'")
-
-    # 1. Read file content
-    try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            file_content = f.read()
-    except Exception as e:
-        print(f"Error reading file: {e}")
-        return
+    logger.info("Processing: %s", filename)
+    logger.info("Target Page: '%s'", page_title)
+    logger.info("Parent Page: '%s'", PARENT_PAGE_TITLE)
 
     # 2. Prepare Page Content
     # We use pure CDATA and only escape the CDATA closing tag if it appears in the code.
-    safe_content = file_content.replace('\r\n', '\n')
-    safe_content = safe_content.replace(']]>', ']]]]><![CDATA[>')
+    safe_content = cdata_safe_text(raw)
     
     # Confluence XML Storage Format
     # We use the 'code' macro to display the script nicely
@@ -62,32 +65,57 @@ def upload_skill_file(file_path: str, page_title: str = None):
     """
 
     # 3. Create or Update the Page
-    print("Creating/Updating page wrapper...")
-    # Note: This function prints status to console
-    new_page(page_title, html_content)
+    logger.info("Creating/Updating page wrapper...")
+    # Note: This function logs its status
+    page_id = new_page(page_title, html_content)
     
-    # 4. Get Page ID (needed for attachment upload)
-    try:
-        page_id = get_page_id_by_title(page_title)
-    except Exception as e:
-        print(f"Error getting page ID: {e}")
-        return
+    # 4. Get Page ID (needed for attachment upload), unless new_page already returned it
+    if not page_id:
+        try:
+            page_id = get_page_id_by_title(page_title)
+        except Exception as e:
+            logger.error("Error getting page ID: %s", e)
+            return
 
     # 5. Upload the .ils file as an attachment
-    print(f"Uploading '{filename}' as attachment...")
-    with open(file_path, 'rb') as f:
-        file_bytes = f.read()
-    
+    logger.info("Uploading '%s' as attachment...", filename)
     try:
         # MIME type 'text/plain' allows it to be previewed in browser often
-        upload_attachment_to_page(page_id, filename, file_bytes, mime_type="text/plain")
-        print("Attachment uploaded successfully.")
+        upload_attachment_to_page(page_id, filename, raw, mime_type="text/plain")
+        logger.info("Attachment uploaded successfully.")
     except Exception as e:
-        print(f"Error uploading attachment: {e}")
+        logger.error("Error uploading attachment: %s", e)
+
+    logger.info(
+        "SUCCESS! Page available at: %s/display/%s/%s",
+        os.environ.get('CONFLUENCE_BASE_URL'),
+        os.environ.get('CONFLUENCE_SPACE_KEY'),
+        page_title.replace(' ', '+'),
+    )
 
-    print(f"\nSUCCESS! Page available at: {os.environ.get('CONFLUENCE_BASE_URL')}/display/{os.environ.get('CONFLUENCE_SPACE_KEY')}/{page_title.replace(' ', '+')}")
+def upload_skill_files(file_paths: list, page_titles: list = None, max_workers: int = 8):
+    """
+    Uploads several SKILL files concurrently, one upload_skill_file pipeline per file.
+    page_titles, if given, line up with file_paths; a missing (or None) title defaults to the
+    filename. Raises ValueError if there are more titles than files.
+    The work is network-bound, so threads sharing the pooled Confluence session are enough.
+    """
+    page_titles = list(page_titles or [])
+    if len(page_titles) > len(file_paths):
+        raise ValueError(
+            f"Got {len(page_titles)} page titles for {len(file_paths)} files"
+        )
+    # Pad so executor.map (which stops at the shorter input) processes every file
+    page_titles += [None] * (len(file_paths) - len(page_titles))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # list() waits for every upload and re-raises the first unexpected error
+        list(executor.map(upload_skill_file, file_paths, page_titles))
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    log_configuration()
+
     # === SETTINGS ===
     # Change these variables to match your file
     
@@ -97,11 +125,11 @@ if __name__ == "__main__":
     # 2. The title of the new sub-page to create
     MY_PAGE_TITLE = "My SKILL Script (Example)"
 
-    # Create a dummy file for testing if it doesn't exist
-    if not os.path.exists(MY_FILE_PATH):
+    # Create a dummy file for testing if it doesn't exist (opt-in: set UPLOAD_ILS_CREATE_SAMPLE=1)
+    if os.environ.get("UPLOAD_ILS_CREATE_SAMPLE") == "1" and not os.path.exists(MY_FILE_PATH):
         with open(MY_FILE_PATH, "w") as f:
             f.write("; This is a sample .ils file\n(procedure (helloWorld)\n  (println \"Hello from Confluence!\")\n)")
-            print(f"Created dummy file '{MY_FILE_PATH}' for testing.")
+            logger.info("Created dummy file '%s' for testing.", MY_FILE_PATH)
 
     # Run the upload
     upload_skill_file(MY_FILE_PATH, MY_PAGE_TITLE)
@@ -1,202 +1,483 @@
+import hashlib
+import html
+import json
+import logging
 import os
+import re
 import sys
+import time
 import mimetypes
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Import functions from the main library
 try:
-    from confluence_automation import new_page, upload_attachment_to_page, get_page_id_by_title, PARENT_PAGE_TITLE
+    from confluence_automation import new_page, upload_attachment_to_page, get_page_id_by_title, get_or_create_page, cdata_safe_text, log_configuration, PARENT_PAGE_TITLE
 except ImportError:
     print("Error: Could not import 'confluence_automation.py'. Make sure it is in the same folder.")
     sys.exit(1)
 
+logger = logging.getLogger(__name__)
+
 # Define supported extensions
 CODE_EXTENSIONS = ('.ils', '.il')
 IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp')
 OFFICE_EXTENSIONS = ('.pptx', '.ppt', '.xlsx', '.xls', '.docx', '.doc')
 ALL_SUPPORTED_EXTENSIONS = CODE_EXTENSIONS + IMAGE_EXTENSIONS + OFFICE_EXTENSIONS
+# Matches a supported extension at the end of a filename, in any case, and captures it.
+# Built from the tuples above so the two can't drift apart; longest alternatives first.
+_EXT_RE = re.compile(
+    "(%s)\\Z" % "|".join(re.escape(ext) for ext in sorted(ALL_SUPPORTED_EXTENSIONS, key=len, reverse=True)),
+    re.IGNORECASE,
+)
 
-def get_content_body_for_file(filename, file_path):
-    """
-    Generates the HTML storage format content based on file type.
-    """
-    ext = os.path.splitext(filename)[1].lower()
-    
-    # Common Download Link used for all types
-    download_section = f"""
-        <h3>Download</h3>
-        <p>
-          <ac:link>
-            <ri:attachment ri:filename="{filename}" />
-            <ac:plain-text-link-body><![CDATA[Download {filename}]]></ac:plain-text-link-body>
-          </ac:link>
-        </p>
-    """
+# Code files larger than this are only attached, not inlined in the page: it keeps the
+# page body (and the request carrying it) bounded, well under Confluence's size limit
+_INLINE_MAX_BYTES = 256 * 1024
 
-    if ext in CODE_EXTENSIONS:
-        # Code Logic (Read file, wrap in code macro)
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                raw_content = f.read()
-            # Escape for CDATA
-            safe_content = raw_content.replace(']]>', ']]]]><![CDATA[>')
-            
-            body = f"""
-            <p><b>Filename:</b> {filename}</p>
-            {download_section}
+# Per-directory record of files already uploaded, so re-runs only process new/changed ones
+MANIFEST_FILENAME = ".ils_upload_manifest.json"
+# The manifest is rewritten in batches (every N finished files or every few seconds),
+# not after each file: rewriting it per file is O(N^2) bytes and, in a synced folder,
+# one sync per file
+_MANIFEST_SAVE_EVERY = 50
+_MANIFEST_SAVE_INTERVAL = 5.0
+
+# MIME type per extension, filled on first use
+_MIME_CACHE = {}
+
+# Fixed parts of the code macro; the (possibly large) file content is joined in between
+_CODE_MACRO_OPEN = """
             <h3>Source Code</h3>
             <ac:structured-macro ac:name="code">
                 <ac:parameter ac:name="language">lisp</ac:parameter> 
                 <ac:parameter ac:name="linenumbers">true</ac:parameter>
                 <ac:parameter ac:name="theme">Midnight</ac:parameter>
-                <ac:plain-text-body><![CDATA[{safe_content}]]></ac:plain-text-body>
+                <ac:plain-text-body><![CDATA["""
+_CODE_MACRO_CLOSE = """]]></ac:plain-text-body>
             </ac:structured-macro>
             """
-            return body
-            
-        except Exception as e:
-            print(f"  Error reading text file content: {e}")
-            return f"<p>Error reading file content.</p>{download_section}"
 
-    elif ext in IMAGE_EXTENSIONS:
-        # Image Logic (Display image)
-        body = f"""
-        <p><b>Filename:</b> {filename}</p>
+# Common Download Link used for all types
+_DOWNLOAD_TEMPLATE = """
+        <h3>Download</h3>
+        <p>
+          <ac:link>
+            <ri:attachment {filename_attr} />
+            <ac:plain-text-link-body><![CDATA[Download {filename}]]></ac:plain-text-link-body>
+          </ac:link>
+        </p>
+    """
+
+def _filename_fragments(filename):
+    """
+    Returns (name_html, filename_attr): the filename escaped for page text and the
+    ready-made ri:filename="..." attribute. Built once per file and reused by every
+    part of its body; escaping also keeps names containing '"', '<' or '&' valid markup.
+    """
+    name_html = html.escape(filename, quote=True)
+    return name_html, f'ri:filename="{name_html}"'
+
+def _code_body(filename, file_path, file_bytes, size):
+    """Code Logic (Read file, wrap in code macro)"""
+    name_html, filename_attr = _filename_fragments(filename)
+    download_section = _DOWNLOAD_TEMPLATE.format(filename_attr=filename_attr, filename=filename)
+    try:
+        if file_bytes is not None:
+            size = len(file_bytes)
+        elif size is None:
+            size = os.path.getsize(file_path)
+        if size > _INLINE_MAX_BYTES:
+            # Too large to inline: link the attachment only, without reading the file
+            return "".join([
+                f"<p><b>Filename:</b> {name_html}</p>",
+                download_section,
+                "<p><i>File too large to inline, see attachment.</i></p>",
+            ])
+
+        if file_bytes is None:
+            with open(file_path, 'rb') as f:
+                file_bytes = f.read()
+        safe_content = cdata_safe_text(file_bytes)
+        
+        body = "".join([
+            f"""
+            <p><b>Filename:</b> {name_html}</p>
+            {download_section}""",
+            _CODE_MACRO_OPEN,
+            safe_content,
+            _CODE_MACRO_CLOSE,
+        ])
+        return body
+        
+    except Exception as e:
+        logger.error("  Error reading text file content of '%s': %s", filename, e)
+        return f"<p>Error reading file content.</p>{download_section}"
+
+def _image_body(filename, file_path, file_bytes, size):
+    """Image Logic (Display image)"""
+    name_html, filename_attr = _filename_fragments(filename)
+    return "".join([
+        f"""
+        <p><b>Filename:</b> {name_html}</p>
         <p>
             <ac:image>
-                <ri:attachment ri:filename="{filename}" />
+                <ri:attachment {filename_attr} />
             </ac:image>
         </p>
-        {download_section}
-        """
-        return body
+        """,
+        _DOWNLOAD_TEMPLATE.format(filename_attr=filename_attr, filename=filename),
+    ])
 
-    elif ext in OFFICE_EXTENSIONS:
-        # Office Logic (View File macro)
-        # Note: 'view-file' macro is common, but sometimes 'viewdoc', 'viewxls', 'viewppt' are preferred.
-        # We'll try the generic 'view-file' which often auto-detects.
-        body = f"""
-        <p><b>Filename:</b> {filename}</p>
-        {download_section}
-        <h3>Preview</h3>
+def _office_body(filename, file_path, file_bytes, size):
+    """Office Logic (View File macro)"""
+    name_html, filename_attr = _filename_fragments(filename)
+    # Note: 'view-file' macro is common, but sometimes 'viewdoc', 'viewxls', 'viewppt' are preferred.
+    # We'll try the generic 'view-file' which often auto-detects.
+    return "".join([
+        f"""
+        <p><b>Filename:</b> {name_html}</p>""",
+        _DOWNLOAD_TEMPLATE.format(filename_attr=filename_attr, filename=filename),
+        f"""<h3>Preview</h3>
         <p>
             <ac:structured-macro ac:name="view-file">
-                <ac:parameter ac:name="name"><ri:attachment ri:filename="{filename}" /></ac:parameter>
+                <ac:parameter ac:name="name"><ri:attachment {filename_attr} /></ac:parameter>
             </ac:structured-macro>
         </p>
-        """
-        return body
+        """,
+    ])
 
-    else:
-        # Fallback
-        return f"<p><b>Filename:</b> {filename}</p>{download_section}"
+def _fallback_body(filename, file_path, file_bytes, size):
+    """Fallback (download link only)"""
+    name_html, filename_attr = _filename_fragments(filename)
+    return "".join([
+        f"<p><b>Filename:</b> {name_html}</p>",
+        _DOWNLOAD_TEMPLATE.format(filename_attr=filename_attr, filename=filename),
+    ])
+
+# Body builder per lowercase extension; anything else gets _fallback_body
+_HANDLERS = {
+    **{ext: _code_body for ext in CODE_EXTENSIONS},
+    **{ext: _image_body for ext in IMAGE_EXTENSIONS},
+    **{ext: _office_body for ext in OFFICE_EXTENSIONS},
+}
+
+def get_content_body_for_file(filename, file_path, file_bytes: bytes = None, ext: str = None, size: int = None):
+    """
+    Generates the HTML storage format content based on file type.
+    file_bytes, if the caller already read the file, is used instead of reading it again.
+    size, if the caller already knows the file size, saves statting the file again.
+    ext is the lowercase extension, if the caller already computed it.
+    """
+    if ext is None:
+        # Bare filename, so a plain rfind is enough (no drive/separator handling needed)
+        dot = filename.rfind('.')
+        ext = filename[dot:].lower() if dot != -1 else ''
+    return _HANDLERS.get(ext, _fallback_body)(filename, file_path, file_bytes, size)
+
+def _guess_mime_type(ext: str) -> str:
+    """
+    Returns the MIME type for a lowercase file extension, defaulting to application/octet-stream.
+    Guessed from the extension alone (no path handling) and cached, as a folder holds many files of each type.
+    """
+    mime_type = _MIME_CACHE.get(ext)
+    if mime_type is None:
+        mime_type = mimetypes.guess_type("x" + ext, strict=False)[0] or "application/octet-stream"
+        _MIME_CACHE[ext] = mime_type
+    return mime_type
+
+def _entry_size(entry) -> int:
+    """Size in bytes of a scanned directory entry; 0 if it cannot be determined."""
+    try:
+        return entry.stat(follow_symlinks=False).st_size
+    except OSError:
+        return 0
+
+def _load_manifest(manifest_path: str) -> dict:
+    """Reads the upload manifest (filename -> record); empty if missing or unreadable."""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable upload manifest '%s': %s", manifest_path, e)
+        return {}
+
+def _save_manifest(manifest_path: str, manifest: dict):
+    """Writes the manifest atomically (temp file + os.replace) so an interrupted run never leaves it half-written."""
+    tmp_path = manifest_path + ".tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, manifest_path)
+    except OSError as e:
+        logger.warning("Could not write upload manifest '%s': %s", manifest_path, e)
+
+def _sha256_of_file(file_path: str) -> str:
+    """Hex SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
 
-def upload_ils_directory(directory_path: str, directory_page_title: str, section_parent_title: str = "Skill Resource"):
+class _HashingReader:
+    """
+    Wraps a binary file and feeds every chunk read from it into a SHA-256 digest, so the
+    manifest hash of an uploaded file comes from the upload's own read, not a second pass.
+    """
+
+    def __init__(self, f):
+        self._f = f
+        self.digest = hashlib.sha256()
+
+    def read(self, *args):
+        data = self._f.read(*args)
+        self.digest.update(data)
+        return data
+
+def _is_already_uploaded(entry, record: dict, directory_page_id: str) -> bool:
+    """
+    True if the manifest record shows this exact file was already uploaded under the same
+    directory page. Size and mtime are checked first; the content hash is only computed
+    when the mtime changed (e.g. the file was copied or re-synced), and a match refreshes
+    the recorded mtime.
+    """
+    if not record or record.get("parent_id") != directory_page_id:
+        return False
+    st = entry.stat(follow_symlinks=False)
+    if st.st_size != record.get("size"):
+        return False
+    if st.st_mtime == record.get("mtime"):
+        return True
+    if record.get("sha256") == _sha256_of_file(entry.path):
+        record["mtime"] = st.st_mtime
+        return True
+    return False
+
+def _process_file(entry, ext: str, directory_page_title: str, directory_page_id: str = None):
+    """
+    Creates the sub-page for one directory entry under directory_page_title
+    and uploads the file itself as an attachment to it.
+    directory_page_id, when known, saves resolving the directory page by title.
+    Returns the file's manifest record if both steps succeeded, otherwise None.
+    """
+    filename = entry.name
+    file_path = entry.path
+    
+    # The sub-page title will be the filename
+    page_title = filename 
+    
+    logger.info("Processing file: %s", filename)
+    
+    # Code files are embedded in the page, so read them once here and reuse the
+    # bytes for the attachment. Other types, and code files too large to inline,
+    # are only read for the upload.
+    size = _entry_size(entry)
+    file_bytes = None
+    if ext in CODE_EXTENSIONS and size <= _INLINE_MAX_BYTES:
+        try:
+            with open(file_path, 'rb') as f:
+                file_bytes = f.read()
+        except Exception as e:
+            logger.error("  Error reading file '%s': %s", filename, e)
+
+    # Determine content body based on file type
+    child_html = get_content_body_for_file(filename, file_path, file_bytes, ext, size)
+
+    # Create the sub-page
+    # IMPORTANT: parent is now 'directory_page_title' (the page we created in Step 2)
+    logger.info("  Creating sub-page '%s' under '%s'...", page_title, directory_page_title)
+    sub_page_id = None
+    try:
+        # new_page returns the page ID from the create/update response
+        sub_page_id = new_page(page_title, child_html, parent=directory_page_title, parent_id=directory_page_id)
+    except Exception as e:
+        logger.error("  Error creating page '%s': %s", page_title, e)
+        # If the page already exists, we might want to attach anyway?
+        # For now, we continue, but we need the page ID to attach the file.
+        pass
+
+    # Upload Attachment
+    try:
+        # Only look the page up by title if creating/updating it didn't give us its ID
+        if not sub_page_id:
+            sub_page_id = get_page_id_by_title(page_title)
+        
+        if not sub_page_id:
+            logger.warning("  Skipping attachment upload: Could not find page ID for '%s'", page_title)
+            return None
+
+        # Guess Mime Type
+        mime_type = _guess_mime_type(ext)
+
+        if file_bytes is not None:
+            # Code files: reuse the bytes already read for the page body
+            upload_attachment_to_page(sub_page_id, filename, file_bytes, mime_type=mime_type)
+        else:
+            # Everything else (images, office documents) is handed over as an open file so it
+            # is hashed from the same read; requests still buffers the whole multipart body
+            with open(file_path, 'rb') as f:
+                reader = _HashingReader(f)
+                upload_attachment_to_page(sub_page_id, filename, reader, mime_type=mime_type)
+        logger.info("  Attachment '%s' uploaded successfully (%s).", filename, mime_type)
+        
+    except Exception as e:
+        logger.error("  Error uploading attachment '%s': %s", filename, e)
+        return None
+
+    st = entry.stat(follow_symlinks=False)
+    return {
+        "page_id": sub_page_id,
+        "parent_id": directory_page_id,
+        "size": st.st_size,
+        "mtime": st.st_mtime,
+        # Hash of the bytes that were just uploaded; no extra read of the file
+        "sha256": hashlib.sha256(file_bytes).hexdigest() if file_bytes is not None else reader.digest.hexdigest(),
+    }
+
+def upload_ils_directory(directory_path: str, directory_page_title: str, section_parent_title: str = "Skill Resource", max_workers: int = 8, resume: bool = True):
     """
     Creates a 3-level hierarchy:
     1. section_parent_title (e.g., 'Skill Resource') - Created under the global Parent
     2. directory_page_title (e.g., 'My Folder') - Created under Skill Resource
-    3. File pages - Created under My Folder
+    3. File pages - Created under My Folder, up to max_workers files at a time
+    Files recorded as uploaded in the directory's MANIFEST_FILENAME and unchanged since
+    are skipped; pass resume=False to upload everything again.
     """
     
-    if not os.path.exists(directory_path):
-        print(f"Error: Directory not found at '{directory_path}'")
+    # Find all supported files first: an empty directory needs no pages at all.
+    # scandir yields each entry's name, full path and file type from the directory
+    # listing itself, without extra stat/join work (and reports a missing directory).
+    # Each entry is kept with its lowercase extension so it is only computed once.
+    entries = []
+    try:
+        with os.scandir(directory_path) as it:
+            for e in it:
+                # One regex pass filters the name and captures its extension; only
+                # that short suffix is lowercased, never the whole filename
+                m = _EXT_RE.search(e.name)
+                if m and e.is_file(follow_symlinks=False):
+                    entries.append((e, m.group(1).lower()))
+    except (FileNotFoundError, NotADirectoryError):
+        logger.error("Directory not found at '%s'", directory_path)
         return
 
-    print(f"=== Starting Directory Upload ===")
-    print(f"Source Dir:      {directory_path}")
-    print(f"Section Parent:  {section_parent_title}")
-    print(f"Directory Page:  {directory_page_title}")
-    print(f"Global Parent:   {PARENT_PAGE_TITLE}")
-    print("=================================\n")
+    if not entries:
+        logger.info("No supported files found in '%s'; nothing to upload.", directory_path)
+        return
+
+    # One multi-line record rather than a separate write per line
+    logger.info(
+        "=== Starting Directory Upload ===\n"
+        "Source Dir:      %s\n"
+        "Section Parent:  %s\n"
+        "Directory Page:  %s\n"
+        "Global Parent:   %s\n"
+        "Supported Files: %d\n"
+        "=================================",
+        directory_path, section_parent_title, directory_page_title, PARENT_PAGE_TITLE, len(entries),
+    )
 
     # --- Step 1: Ensure the Section Parent Exists (e.g., 'Skill Resource') ---
-    # We create this under the PARENT_PAGE_TITLE defined in .env
-    print(f"Ensuring section parent '{section_parent_title}' exists...")
+    # We create this under the PARENT_PAGE_TITLE defined in .env, only if it is missing
+    logger.info("Ensuring section parent '%s' exists...", section_parent_title)
     section_content = f"""
     <p>This section contains resources and libraries.</p>
     <ac:structured-macro ac:name="children" />
     """
     try:
-        new_page(section_parent_title, section_content, parent=PARENT_PAGE_TITLE)
+        section_page_id = get_or_create_page(section_parent_title, section_content, parent=PARENT_PAGE_TITLE)
     except Exception as e:
-        print(f"CRITICAL ERROR creating section parent: {e}")
+        logger.critical("Error creating section parent: %s", e)
         return
 
-    # --- Step 2: Create the Directory container Page ---
-    # This page will act as the folder. Created under 'section_parent_title'
+    # normpath first so a trailing separator doesn't produce an empty name
+    dir_basename = os.path.basename(os.path.normpath(directory_path))
+
+    # --- Step 2: Ensure the Directory container Page Exists ---
+    # This page will act as the folder. Created under 'section_parent_title' if missing
     container_content = f"""
-    <p>This page contains resources imported from directory: <b>{os.path.basename(directory_path)}</b></p>
+    <p>This page contains resources imported from directory: <b>{dir_basename}</b></p>
     <p><i>Structure created by automation script.</i></p>
     
     <h3>Contents</h3>
     <ac:structured-macro ac:name="children" />
     """
     
-    print(f"Creating directory page '{directory_page_title}' under '{section_parent_title}'...")
+    logger.info("Ensuring directory page '%s' exists under '%s'...", directory_page_title, section_parent_title)
     try:
-        new_page(directory_page_title, container_content, parent=section_parent_title)
+        # Reuse the section page's ID instead of resolving it by title again
+        directory_page_id = get_or_create_page(
+            directory_page_title, container_content, parent=section_parent_title, parent_id=section_page_id
+        )
     except Exception as e:
-        print(f"CRITICAL ERROR creating directory page: {e}")
+        logger.critical("Error creating directory page: %s", e)
         return
 
     # --- Step 3: Process Files ---
-    # Find all supported files
-    files = [f for f in os.listdir(directory_path) if f.lower().endswith(ALL_SUPPORTED_EXTENSIONS)]
-    
-    if not files:
-        print("No supported files found in this directory.")
-        return
-
-    print(f"Found {len(files)} supported files. Processing...")
-
-    for filename in files:
-        file_path = os.path.join(directory_path, filename)
-        
-        # The sub-page title will be the filename
-        page_title = filename 
-        
-        print(f"\nProcessing file: {filename}")
-        
-        # Determine content body based on file type
-        child_html = get_content_body_for_file(filename, file_path)
-
-        # Create the sub-page
-        # IMPORTANT: parent is now 'directory_page_title' (the page we created in Step 2)
-        print(f"  Creating sub-page '{page_title}' under '{directory_page_title}'...")
-        try:
-            new_page(page_title, child_html, parent=directory_page_title)
-        except Exception as e:
-            print(f"  Error creating page: {e}")
-            # If the page already exists, we might want to attach anyway?
-            # For now, we continue, but we need the page ID to attach the file.
-            pass
 
-        # Upload Attachment
+    # Skip files the manifest shows were already uploaded, unchanged, under this directory page
+    manifest_path = os.path.join(directory_path, MANIFEST_FILENAME)
+    manifest = _load_manifest(manifest_path) if resume else {}
+    pending = []
+    for entry, ext in entries:
         try:
-            # We need the ID of the specific sub-page we just created (or existing one)
-            sub_page_id = get_page_id_by_title(page_title)
-            
-            if not sub_page_id:
-                print(f"  Skipping attachment upload: Could not find page ID for '{page_title}'")
+            if _is_already_uploaded(entry, manifest.get(entry.name), directory_page_id):
                 continue
+        except OSError:
+            pass
+        pending.append((entry, ext))
+    if len(pending) < len(entries):
+        logger.info("Skipping %d unchanged files already uploaded.", len(entries) - len(pending))
+        # Persist any mtimes refreshed by the hash check
+        _save_manifest(manifest_path, manifest)
+    entries = pending
+    if not entries:
+        logger.info("Nothing new to upload.")
+        return
 
-            # Guess Mime Type
-            mime_type, _ = mimetypes.guess_type(file_path)
-            if mime_type is None:
-                mime_type = "application/octet-stream"
+    # Submit the largest files first so a few big uploads don't start last and
+    # leave a long tail after all the small ones are done (sort is stable, so
+    # equal or unknown sizes keep directory order)
+    entries.sort(key=lambda item: _entry_size(item[0]), reverse=True)
 
-            with open(file_path, 'rb') as f:
-                file_bytes = f.read()
-                
-            upload_attachment_to_page(sub_page_id, filename, file_bytes, mime_type=mime_type)
-            print(f"  Attachment uploaded successfully ({mime_type}).")
-            
-        except Exception as e:
-            print(f"  Error uploading attachment: {e}")
+    # Files are independent once the directory page exists, so upload them in parallel.
+    # The work is network-bound; the threads share the pooled Confluence session.
+    unsaved = 0
+    last_save = time.monotonic()
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_process_file, entry, ext, directory_page_title, directory_page_id): entry.name
+                for entry, ext in entries
+            }
+            for future in as_completed(futures):
+                try:
+                    record = future.result()
+                except Exception as e:
+                    logger.error("  Unexpected error processing '%s': %s", futures[future], e)
+                    continue
+                if record is None:
+                    continue
+                manifest[futures[future]] = record
+                unsaved += 1
+                # Saved periodically, so an interrupted run resumes close to where it stopped
+                if unsaved >= _MANIFEST_SAVE_EVERY or time.monotonic() - last_save >= _MANIFEST_SAVE_INTERVAL:
+                    _save_manifest(manifest_path, manifest)
+                    unsaved = 0
+                    last_save = time.monotonic()
+    finally:
+        # Whatever finished since the last batch, also when the run is interrupted
+        if unsaved:
+            _save_manifest(manifest_path, manifest)
 
-    print("\nBatch upload complete.")
+    logger.info("Batch upload complete.")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    log_configuration()
+
     # === INSTRUCTIONS ===
     # 1. Update TARGET_DIRECTORY to point to the folder on your computer containing .ils files
     # 2. Update DIRECTORY_PAGE_NAME to the title you want for the "Folder" page in Confluence
@@ -206,11 +487,15 @@ if __name__ == "__main__":
     DIRECTORY_PAGE_NAME = "2025" # The Folder Page
     SECTION_PAGE_NAME = "TDFX" # The Intermediate Page
 
-    # Create dummy testing data if it doesn't exist
-    if not os.path.exists(TARGET_DIRECTORY):
-        os.makedirs(TARGET_DIRECTORY, exist_ok=True)
-        with open(os.path.join(TARGET_DIRECTORY, "example_script.ils"), "w") as f:
+    # Create dummy testing data if it doesn't exist. Attempting the mkdir directly
+    # (instead of checking first) is one call and can't race with another process.
+    try:
+        os.makedirs(TARGET_DIRECTORY)
+    except FileExistsError:
+        pass
+    else:
+        with open(os.path.join(TARGET_DIRECTORY, "example_script.ils"), "x") as f:
              f.write(";; This is a test script\n(println 'Hello-World)")
-        print(f"Created a sample folder at {TARGET_DIRECTORY} for testing.")
+        logger.info("Created a sample folder at %s for testing.", TARGET_DIRECTORY)
 
     upload_ils_directory(TARGET_DIRECTORY, DIRECTORY_PAGE_NAME, SECTION_PAGE_NAME)